@@ -10,61 +10,100 @@ Usage (from lab1/notebooks/):
 Output: yassir_dashboard.html  (open in any browser)
 """
 
+import numpy as np
 import pandas as pd
 import json
 import re
-from collections import Counter
 from datetime import datetime
 import os
+import hashlib
 
 # ─── CONFIG ──────────────────────────────────────────────────
-CSV_PATH  = '../data/processed/yassir_customers_processed.csv'
-OUT_PATH  = 'yassir_dashboard.html'
-SAMPLE_N  = 1500   # reviews sampled for language detection
+CSV_PATH   = '../data/processed/yassir_customers_processed.csv'
+OUT_PATH   = 'yassir_dashboard.html'
+CSV_COLS   = ['review_date', 'review_year', 'review_month', 'text', 'rating',
+              'thumbs_up_count', 'author', 'text_length']   # the only columns used below
+# all numeric columns fit in narrow ints; smaller columns make every later scan cheaper
+CSV_DTYPES = [('review_year', 'int16'), ('review_month', 'int8'), ('rating', 'int8'),
+              ('text_length', 'int32'), ('thumbs_up_count', 'int32')]
+DATE_FMT   = '%Y-%m-%d'
+# parsed + typed frame; bump CACHE_VERSION when the load steps change in a way the key can't see
+CACHE_VERSION = 1
+_cache_key = hashlib.sha1(repr((CACHE_VERSION, CSV_COLS, CSV_DTYPES, DATE_FMT, pd.__version__)).encode()).hexdigest()[:10]
+CACHE_PATH = CSV_PATH.replace('.csv', f'.{_cache_key}.pkl')   # rebuilt when the CSV is newer or the key changes
+
+# ─── PATTERNS ─────────────────────────────────────────────────
+# compiled once; the word tokenizer and the language heuristic share one Latin class
+_LATIN_CHARS = 'a-zA-Zéèàùôâêîûïëüœ'
+_WORD_RE     = re.compile(f'[{_LATIN_CHARS}]{{4,}}')
+_LATIN_RE    = re.compile(f'[{_LATIN_CHARS}]')
+_ARABIC_RE   = re.compile(r'[\u0600-\u06FF]')
 
 # ─── LOAD ─────────────────────────────────────────────────────
-print("📂 Loading CSV...")
-df = pd.read_csv(CSV_PATH)
-df['review_date'] = pd.to_datetime(df['review_date'], errors='coerce')
-df['review_year']  = df['review_year'].astype(int)
-df['review_month'] = df['review_month'].astype(int)
-df['text'] = df['text'].fillna('').astype(str)
+df = None
+if os.path.exists(CACHE_PATH) and os.path.getmtime(CACHE_PATH) >= os.path.getmtime(CSV_PATH):
+    print("📂 Loading cached frame...")
+    try:
+        df = pd.read_pickle(CACHE_PATH)
+    except Exception as e:   # unreadable or incompatible cache: fall back to the CSV
+        print(f"   ⚠️  Cache unreadable ({type(e).__name__}), rebuilding from CSV")
+        df = None
+if df is None:
+    print("📂 Loading CSV...")
+    df = pd.read_csv(CSV_PATH, usecols=CSV_COLS)
+    df['review_date'] = pd.to_datetime(df['review_date'], format=DATE_FMT, errors='coerce', cache=True)
+    for col, dtype in CSV_DTYPES:
+        df[col] = df[col].astype(dtype)
+    df['text'] = df['text'].fillna('').astype(str)
+    df.to_pickle(CACHE_PATH)
 print(f"   ✅ {len(df):,} reviews loaded")
 
 # ─── DERIVED COLUMNS ──────────────────────────────────────────
-df['sentiment'] = df['rating'].apply(
-    lambda r: 'Positive' if r >= 4 else ('Negative' if r <= 2 else 'Neutral')
+# rating predicates computed once and reused for sentiment and the KPI counts
+rv     = df['rating'].to_numpy()
+is_pos = rv >= 4
+is_neg = rv <= 2
+is_neu = rv == 3
+df['sentiment'] = pd.Categorical(
+    np.select([is_pos, is_neg], ['Positive', 'Negative'], default='Neutral'),
+    categories=['Negative', 'Neutral', 'Positive'],
 )
+# lowercased once; reused by the word analysis and the language markers
+text_lower = df['text'].str.lower()
 
 # ─── KPI ──────────────────────────────────────────────────────
 print("📊 Computing KPIs...")
+avg_len = df.groupby('sentiment', sort=False, observed=True)['text_length'].mean()
+
 total        = len(df)
 avg_rating   = round(df['rating'].mean(), 2)
-pct_positive = round(len(df[df['rating'] >= 4]) / total * 100, 1)
-pct_negative = round(len(df[df['rating'] <= 2]) / total * 100, 1)
-pct_neutral  = round(len(df[df['rating'] == 3]) / total * 100, 1)
 date_min     = df['review_date'].min().strftime('%Y-%m-%d')
 date_max     = df['review_date'].max().strftime('%Y-%m-%d')
 n_years      = df['review_year'].nunique()
-count_pos    = len(df[df['rating'] >= 4])
-count_neg    = len(df[df['rating'] <= 2])
-count_neu    = len(df[df['rating'] == 3])
-avg_len_pos  = round(df[df['sentiment']=='Positive']['text_length'].mean())
-avg_len_neu  = round(df[df['sentiment']=='Neutral']['text_length'].mean())
-avg_len_neg  = round(df[df['sentiment']=='Negative']['text_length'].mean())
+count_pos    = int(is_pos.sum())
+count_neg    = int(is_neg.sum())
+count_neu    = int(is_neu.sum())
+pct_positive = round(count_pos / total * 100, 1)
+pct_negative = round(count_neg / total * 100, 1)
+pct_neutral  = round(count_neu / total * 100, 1)
+avg_len_pos  = round(avg_len['Positive'])
+avg_len_neu  = round(avg_len['Neutral'])
+avg_len_neg  = round(avg_len['Negative'])
 
 # ─── RATINGS DISTRIBUTION ─────────────────────────────────────
 print("⭐ Rating distributions...")
 def rating_dist(sub):
-    return [int(len(sub[sub['rating']==r])) for r in [1,2,3,4,5]]
+    return np.bincount(sub['rating'].to_numpy(), minlength=6)[1:6].tolist()
 
 rating_all = rating_dist(df)
 
 # Per year (full years only)
 full_years = [y for y in sorted(df['review_year'].unique()) if y < datetime.now().year]
-rating_by_year = {}
-for y in full_years:
-    rating_by_year[str(y)] = rating_dist(df[df['review_year'] == y])
+# one (year × star) table, shared with the stacked bar below
+year_rating = (df.groupby(['review_year', 'rating']).size()
+                 .unstack(fill_value=0)
+                 .reindex(index=full_years, columns=[1,2,3,4,5], fill_value=0))
+rating_by_year = {str(y): counts.tolist() for y, counts in zip(full_years, year_rating.to_numpy())}
 
 # ─── YEARLY / MONTHLY VOLUMES ─────────────────────────────────
 print("📅 Temporal data...")
@@ -73,43 +112,46 @@ yearly_labels = [str(y) for y in yearly.index.tolist()]
 yearly_counts = yearly.values.tolist()
 
 # monthly
-df['ym'] = df['review_year'].astype(str) + '-' + df['review_month'].astype(str).str.zfill(2)
-monthly_all = df.groupby('ym').size().sort_index()
-monthly_pos = df[df['sentiment']=='Positive'].groupby('ym').size().reindex(monthly_all.index, fill_value=0)
-monthly_neg = df[df['sentiment']=='Negative'].groupby('ym').size().reindex(monthly_all.index, fill_value=0)
-monthly_labels = monthly_all.index.tolist()
-monthly_all_v  = monthly_all.values.tolist()
-monthly_pos_v  = monthly_pos.values.tolist()
-monthly_neg_v  = monthly_neg.values.tolist()
+# integer yyyymm key (int32: year*100 overflows the int16 year column); formatted only for labels.
+# Stored as an ordered Categorical so the groupbys below work straight off its codes.
+df['ym'] = pd.Categorical(
+    df['review_year'].to_numpy(np.int32) * 100 + df['review_month'].to_numpy(), ordered=True
+)
+monthly = pd.crosstab(df['ym'], df['sentiment']).reindex(
+    columns=['Positive', 'Neutral', 'Negative'], fill_value=0
+).sort_index()
+monthly_labels = [f'{ym // 100}-{ym % 100:02d}' for ym in monthly.index]
+monthly_all_v  = monthly.sum(axis=1).tolist()
+monthly_pos_v  = monthly['Positive'].tolist()
+monthly_neg_v  = monthly['Negative'].tolist()
 
 # monthly avg rating
-monthly_rating = df.groupby('ym')['rating'].mean().reindex(monthly_all.index).round(2)
-monthly_rating_v = monthly_rating.ffill().values.tolist()
+monthly_rating = df.groupby('ym', sort=True, observed=True)['rating'].mean().round(2)
+monthly_rating_v = monthly_rating.ffill().tolist()
 
 # ─── HEATMAP (month × year) ────────────────────────────────────
 print("🗓️  Heatmap data...")
 hm_years  = [y for y in sorted(df['review_year'].unique())]
 hm_months = list(range(1, 13))
-hm_data   = []
+hm_counts = df.groupby(['review_year', 'review_month']).size().to_dict()
+# Column-wise (one list per field) rather than one {x,y,r,v} dict per cell
+hm_x, hm_y, hm_r, hm_v = [], [], [], []
 for yi, yr in enumerate(hm_years):
     for mi, mo in enumerate(hm_months):
-        val = int(len(df[(df['review_year']==yr) & (df['review_month']==mo)]))
+        val = hm_counts.get((yr, mo), 0)
         if val > 0:
-            hm_data.append({'x': yi, 'y': mi, 'r': round((val**0.5)*1.5, 1), 'v': val})
+            hm_x.append(yi); hm_y.append(mi)
+            hm_r.append(round((val**0.5)*1.5, 1)); hm_v.append(val)
 hm_year_labels  = [str(y) for y in hm_years]
 hm_month_labels = ['Jan','Feb','Mar','Apr','May','Jun','Jul','Aug','Sep','Oct','Nov','Dec']
 
 # ─── STACKED BAR (rating × year) ──────────────────────────────
 stacked_years = [str(y) for y in full_years]
-stacked = {str(r): [] for r in [1,2,3,4,5]}
-for y in full_years:
-    sub = df[df['review_year']==y]
-    for r in [1,2,3,4,5]:
-        stacked[str(r)].append(int(len(sub[sub['rating']==r])))
+stacked = {str(r): year_rating[r].tolist() for r in [1,2,3,4,5]}
 
 # ─── WORD ANALYSIS ─────────────────────────────────────────────
 print("☁️  Word frequencies...")
-STOPWORDS = {
+STOPWORDS = frozenset({
     'application','app','yassir','les','des','est','une','pas','que','plus',
     'très','bien','pour','sur','avec','dans','par','qui','ce','tout','mais',
     'cest','cette','comme','avoir','the','and','is','it','to','of','in','for',
@@ -120,62 +162,66 @@ STOPWORDS = {
     'trop','assez','peu','beaucoup','plus','moins','fois','fait','faire',
     'sont','être','avoir','aller','voir','venir','pouvoir','vouloir','savoir',
     'les', 'des', 'est', 'une', 'pas',
-}
+})
+
+def top_words(tokens, n=15):
+    # stable sort keeps first-seen order among ties, like Counter.most_common
+    counts = tokens.value_counts(sort=False).sort_values(ascending=False, kind='stable').head(n)
+    return [{'word': w, 'count': int(c)} for w, c in counts.items()]
 
-def top_words(series, n=15):
-    words = []
-    for text in series:
-        tokens = re.findall(r'[a-zA-Zéèàùôâêîûïëüœ]{4,}', text.lower())
-        words.extend([w for w in tokens if w not in STOPWORDS])
-    counts = Counter(words).most_common(n)
-    return [{'word': w, 'count': c} for w, c in counts]
+# tokenize once; the sentiment label rides along for the per-sentiment lists
+tokens = (df[['sentiment']]
+          .assign(tok=text_lower.str.findall(_WORD_RE))
+          .explode('tok')
+          .dropna(subset=['tok']))
+tokens = tokens[~tokens['tok'].isin(STOPWORDS)]
 
-words_all = top_words(df['text'], 20)
-words_pos = top_words(df[df['sentiment']=='Positive']['text'], 15)
-words_neg = top_words(df[df['sentiment']=='Negative']['text'], 15)
+tokens_by_sent = tokens.groupby('sentiment', observed=True)['tok']
+
+words_all = top_words(tokens['tok'], 20)
+words_pos = top_words(tokens_by_sent.get_group('Positive'), 15)
+words_neg = top_words(tokens_by_sent.get_group('Negative'), 15)
 
 # ─── TOP REVIEWS (by thumbs up) ────────────────────────────────
 print("💬 Top reviews...")
-top_reviews_raw = df.nlargest(12, 'thumbs_up_count')[
-    ['author','rating','thumbs_up_count','review_date','text']
-].fillna({'author':'Anonymous', 'text':''})
+thumbs  = df['thumbs_up_count'].to_numpy()
+n_top   = min(12, len(thumbs))
+# partition finds the 12th-largest count; ties at that cut-off keep row order, like nlargest
+cutoff  = np.partition(thumbs, -n_top)[-n_top]
+cand    = np.flatnonzero(thumbs >= cutoff)
+top_idx = cand[np.argsort(-thumbs[cand], kind='stable')][:n_top]
 
 top_reviews = []
-for _, row in top_reviews_raw.iterrows():
+for author, rating, n_thumbs, date, text in zip(
+    df['author'].to_numpy()[top_idx], df['rating'].to_numpy()[top_idx], thumbs[top_idx],
+    df['review_date'].to_numpy()[top_idx], df['text'].to_numpy()[top_idx],
+):
     top_reviews.append({
-        'author': str(row['author'])[:30],
-        'rating': int(row['rating']),
-        'thumbs': int(row['thumbs_up_count']),
-        'date':   str(row['review_date'])[:10],
-        'text':   str(row['text'])[:300],
+        'author': str(author)[:30] if pd.notna(author) else 'Anonymous',
+        'rating': int(rating),
+        'thumbs': int(n_thumbs),
+        'date':   str(date)[:10],
+        'text':   text[:300],
     })
 
 # ─── LANGUAGE DETECTION ────────────────────────────────────────
 print("🌍 Language detection...")
-def detect_lang(text):
-    text = str(text)
-    arabic = len(re.findall(r'[\u0600-\u06FF]', text))
-    latin  = len(re.findall(r'[a-zA-Zéèàùôâêîûïëüœ]', text))
-    if arabic > latin:
-        return 'Arabic'
-    fr_markers = ['le ','la ','les ','est ','pas ','que ','une ','très ','avec ','pour ','dans ']
-    en_markers = ['the ','and ','this ','that ','very ','not ','good ','was ','have ','you ']
-    t = text.lower()
-    return 'French' if sum(m in t for m in fr_markers) >= sum(m in t for m in en_markers) else 'English'
-
-sample = df.sample(min(SAMPLE_N, len(df)), random_state=42)
-sample = sample.copy()
-sample['lang'] = sample['text'].apply(detect_lang)
-lang_counts_raw = sample['lang'].value_counts()
+FR_MARKERS = ('le ','la ','les ','est ','pas ','que ','une ','très ','avec ','pour ','dans ')
+EN_MARKERS = ('the ','and ','this ','that ','very ','not ','good ','was ','have ','you ')
+
+# every review is classified; each pattern is one vectorized str pass over the frame
+arabic     = df['text'].str.count(_ARABIC_RE).to_numpy()
+latin      = df['text'].str.count(_LATIN_RE).to_numpy()
+fr_score   = sum(text_lower.str.contains(m, regex=False).to_numpy(np.int8) for m in FR_MARKERS)
+en_score   = sum(text_lower.str.contains(m, regex=False).to_numpy(np.int8) for m in EN_MARKERS)
+df['lang'] = np.select([arabic > latin, fr_score >= en_score], ['Arabic', 'French'], default='English')
+
+lang_counts_raw = df['lang'].value_counts()
 lang_labels = lang_counts_raw.index.tolist()
 lang_counts = lang_counts_raw.values.tolist()
 
 # avg rating per language
-lang_ratings = []
-for lang in lang_labels:
-    ids = sample[sample['lang']==lang].index
-    avg = round(df.loc[df.index.isin(ids), 'rating'].mean(), 2) if len(ids) else 0
-    lang_ratings.append(avg)
+lang_ratings = df.groupby('lang')['rating'].mean().round(2).reindex(lang_labels).tolist()
 
 # ─── PACK ALL DATA ─────────────────────────────────────────────
 DATA = {
@@ -195,7 +241,7 @@ DATA = {
         'avg_rating': monthly_rating_v,
     },
     'heatmap': {
-        'data': hm_data,
+        'x': hm_x, 'y': hm_y, 'r': hm_r, 'v': hm_v,
         'year_labels': hm_year_labels,
         'month_labels': hm_month_labels,
     },
@@ -211,7 +257,8 @@ print(f"   Total: {total:,} | Avg: {avg_rating}★ | Positive: {pct_positive}% |
 # ═══════════════════════════════════════════════════════════════
 # HTML TEMPLATE
 # ═══════════════════════════════════════════════════════════════
-data_json = json.dumps(DATA, ensure_ascii=False)
+# embedded as a JSON data block, so '</' is escaped to keep review text from closing the tag
+data_json = json.dumps(DATA, ensure_ascii=False, separators=(',', ':')).replace('</', '<\\/')
 
 HTML = f"""<!DOCTYPE html>
 <html lang="en">
@@ -277,11 +324,11 @@ body::before{{content:'';position:fixed;inset:0;background-image:linear-gradient
 .chart-container{{position:relative;}}
 .insight-box{{background:rgba(108,43,219,0.06);border:1px solid rgba(108,43,219,0.25);border-radius:12px;padding:14px 18px;font-size:12.5px;color:#c0c0d8;line-height:1.7;margin-top:14px;}}
 .insight-box strong{{color:#a855f7;}}
-.wordcloud-container{{display:flex;flex-wrap:wrap;gap:8px;padding:16px;align-items:center;justify-content:center;min-height:200px;}}
-.wc-word{{cursor:default;border-radius:6px;padding:4px 10px;transition:transform 0.2s,opacity 0.2s;font-family:'Syne',sans-serif;font-weight:700;}}
-.wc-word:hover{{transform:scale(1.15);opacity:0.9;}}
+.wordcloud-container{{padding:16px;min-height:200px;}}
+.wordcloud-container canvas{{display:block;width:100%;cursor:default;}}
 .review-list{{display:flex;flex-direction:column;gap:12px;}}
-.review-item{{background:var(--dark3);border:1px solid var(--border);border-radius:12px;padding:16px;transition:border-color 0.2s;}}
+/* off-screen review cards skip layout/paint until scrolled near; 'auto' keeps their last real height */
+.review-item{{background:var(--dark3);border:1px solid var(--border);border-radius:12px;padding:16px;transition:border-color 0.2s;content-visibility:auto;contain-intrinsic-size:auto 160px;}}
 .review-item:hover{{border-color:rgba(108,43,219,0.4);}}
 .review-meta{{display:flex;align-items:center;gap:10px;margin-bottom:8px;}}
 .review-stars{{color:var(--yellow);font-size:13px;}}.review-stars.neg{{color:var(--red);}}
@@ -321,15 +368,15 @@ body::before{{content:'';position:fixed;inset:0;background-image:linear-gradient
   </div>
   <div class="nav">
     <div class="nav-section-label">Analytics</div>
-    <div class="nav-item active" onclick="showPage('overview')"><span class="icon">📊</span> Overview</div>
-    <div class="nav-item" onclick="showPage('ratings')"><span class="icon">⭐</span> Ratings</div>
-    <div class="nav-item" onclick="showPage('trends')"><span class="icon">📈</span> Trends</div>
+    <div class="nav-item active" data-page="overview" onclick="showPage('overview')"><span class="icon">📊</span> Overview</div>
+    <div class="nav-item" data-page="ratings" onclick="showPage('ratings')"><span class="icon">⭐</span> Ratings</div>
+    <div class="nav-item" data-page="trends" onclick="showPage('trends')"><span class="icon">📈</span> Trends</div>
     <div class="nav-section-label">Content</div>
-    <div class="nav-item" onclick="showPage('words')"><span class="icon">☁️</span> Word Analysis</div>
-    <div class="nav-item" onclick="showPage('reviews')"><span class="icon">💬</span> Top Reviews</div>
+    <div class="nav-item" data-page="words" onclick="showPage('words')"><span class="icon">☁️</span> Word Analysis</div>
+    <div class="nav-item" data-page="reviews" onclick="showPage('reviews')"><span class="icon">💬</span> Top Reviews</div>
     <div class="nav-section-label">Context</div>
-    <div class="nav-item" onclick="showPage('languages')"><span class="icon">🌍</span> Languages</div>
-    <div class="nav-item" onclick="showPage('insights')"><span class="icon">💡</span> Insights</div>
+    <div class="nav-item" data-page="languages" onclick="showPage('languages')"><span class="icon">🌍</span> Languages</div>
+    <div class="nav-item" data-page="insights" onclick="showPage('insights')"><span class="icon">💡</span> Insights</div>
   </div>
   <div class="sidebar-footer">
     <div>📱 Yassir - Ride, Eat &amp; Shop</div>
@@ -443,7 +490,7 @@ body::before{{content:'';position:fixed;inset:0;background-image:linear-gradient
   <div class="chart-grid-1 animate-in" style="transition-delay:0.1s">
     <div class="chart-card">
       <div class="chart-card-header"><div><div class="chart-card-title">Word Cloud</div><div class="chart-card-sub">Most frequent words — size = frequency</div></div></div>
-      <div class="wordcloud-container" id="wordcloud"></div>
+      <div class="wordcloud-container"><canvas id="wordcloud"></canvas></div>
     </div>
   </div>
   <div class="chart-grid-2 animate-in" style="transition-delay:0.2s">
@@ -485,10 +532,10 @@ body::before{{content:'';position:fixed;inset:0;background-image:linear-gradient
 
 <!-- PAGE 6: LANGUAGES -->
 <div class="page" id="page-languages">
-  <div class="page-header"><div class="page-title">Language Distribution</div><div class="page-sub">Multilingual analysis — detected from {min(SAMPLE_N, total):,} sampled reviews</div></div>
+  <div class="page-header"><div class="page-title">Language Distribution</div><div class="page-sub">Multilingual analysis — detected across all {total:,} reviews</div></div>
   <div class="chart-grid-2 animate-in">
     <div class="chart-card">
-      <div class="chart-card-header"><div><div class="chart-card-title">Language Share</div><div class="chart-card-sub">Heuristic detection on sample</div></div></div>
+      <div class="chart-card-header"><div><div class="chart-card-title">Language Share</div><div class="chart-card-sub">Heuristic detection on all reviews</div></div></div>
       <div class="chart-container" style="height:260px"><canvas id="langDonut"></canvas></div>
     </div>
     <div class="chart-card">
@@ -529,17 +576,56 @@ body::before{{content:'';position:fixed;inset:0;background-image:linear-gradient
 
 </main>
 
+<script type="application/json" id="dashboard-data">{data_json}</script>
 <script>
-const D = {data_json};
+const D = JSON.parse(document.getElementById('dashboard-data').textContent);
 const C = {{purple:'#6C2BDB',pink:'#E91E8C',green:'#2ecc71',red:'#e74c3c',yellow:'#f39c12',blue:'#3498db',muted:'#7070a0',card:'#16162a',text:'#e8e8f0'}};
 const CD = {{responsive:true,maintainAspectRatio:false,plugins:{{legend:{{labels:{{color:C.text,font:{{family:'DM Sans'}}}}}}}}}};
-
+// Option leaves repeated across charts, shared by reference. Chart.js only reads these, so they are frozen;
+// whole option objects stay per-chart because Chart.js writes scales/plugins (and revealOnce writes animation) onto them.
+const NO_GRID=Object.freeze({{display:false}}),FAINT_GRID=Object.freeze({{color:'rgba(255,255,255,0.04)'}}),MUTED_TICKS=Object.freeze({{color:C.muted}});
+const NO_LEGEND=Object.freeze({{...CD.plugins,legend:Object.freeze({{display:false}})}});
+
+// Min/max decimation: at most two {{x,y}} points per pixel bucket, already in Chart.js' internal
+// format so line charts can skip parsing. Short series pass through one point per index.
+function decimate(data,target){{
+  const n=data.length,pts=[];
+  if(n<=target*2){{for(let i=0;i<n;i++)pts.push({{x:i,y:data[i]}});return pts;}}
+  const step=Math.ceil(n/target);
+  for(let s=0;s<n;s+=step){{
+    const e=Math.min(s+step,n);let lo=s,hi=s;
+    for(let i=s+1;i<e;i++){{if(data[i]<data[lo])lo=i;if(data[i]>data[hi])hi=i;}}
+    if(lo===hi)pts.push({{x:lo,y:data[lo]}});
+    else{{const a=Math.min(lo,hi),b=Math.max(lo,hi);pts.push({{x:a,y:data[a]}},{{x:b,y:data[b]}});}}
+  }}
+  return pts;
+}}
+// Coalesce chart redraws: however many filter clicks land in one frame, each chart updates once.
+const pendingUpdates=new Map();
+function scheduleUpdate(chart){{
+  if(!pendingUpdates.size)requestAnimationFrame(()=>{{pendingUpdates.forEach((_,c)=>c.update('none'));pendingUpdates.clear();}});
+  pendingUpdates.set(chart,true);
+}}
+// Filter-driven charts animate their first reveal only; after that, redraws (and hover
+// transitions) skip the animator entirely.
+const revealOnce=({{chart,initial}})=>{{if(initial)chart.options.animation=false;}};
+// Replace a container's content with a single parse + insertion of the built HTML string.
+function setHTML(el,html){{el.replaceChildren();el.insertAdjacentHTML('beforeend',html);}}
+const plotWidth=id=>document.getElementById(id).parentNode.clientWidth||window.innerWidth;
+
+// Pages and nav items never change, so they are looked up once.
+const PAGES=document.querySelectorAll('.page'),NAV_ITEMS=document.querySelectorAll('.nav-item');
+const PAGE_BY_ID=new Map([...PAGES].map(p=>[p.id.slice(5),p]));
+let currentPage='overview';
 function showPage(id){{
-  document.querySelectorAll('.page').forEach(p=>p.classList.remove('active'));
-  document.querySelectorAll('.nav-item').forEach(n=>n.classList.remove('active'));
-  document.getElementById('page-'+id).classList.add('active');
-  document.querySelectorAll('.nav-item').forEach(n=>{{if(n.getAttribute('onclick')?.includes(id))n.classList.add('active');}});
-  setTimeout(()=>{{document.querySelectorAll('#page-'+id+' .animate-in').forEach((el,i)=>{{setTimeout(()=>el.classList.add('visible'),i*80);}});}},50);
+  if(currentPage!==id&&DESTROY_ON_HIDE.has(currentPage))releasePage(currentPage);
+  currentPage=id;
+  PAGES.forEach(p=>p.classList.remove('active'));
+  const page=PAGE_BY_ID.get(id);
+  page.classList.add('active');
+  if(!initialized.has(id)){{initialized.add(id);PAGE_INIT[id]();}}
+  NAV_ITEMS.forEach(n=>n.classList.toggle('active',n.dataset.page===id));
+  setTimeout(()=>{{page.querySelectorAll('.animate-in').forEach((el,i)=>{{setTimeout(()=>el.classList.add('visible'),i*80);}});}},50);
   if(window.innerWidth<900)toggleSidebar(false);
 }}
 function toggleSidebar(force){{
@@ -549,105 +635,195 @@ function toggleSidebar(force){{
 }}
 
 // ── OVERVIEW ──
-new Chart(document.getElementById('sentimentDonut'),{{type:'doughnut',data:{{labels:['Positive (4-5★)','Neutral (3★)','Negative (1-2★)'],datasets:[{{data:[D.meta.count_pos,D.meta.count_neu,D.meta.count_neg],backgroundColor:[C.green,C.yellow,C.red],borderWidth:3,borderColor:C.card,hoverOffset:8}}]}},options:{{...CD,cutout:'68%',plugins:{{...CD.plugins,tooltip:{{callbacks:{{label:ctx=>` ${{ctx.label}}: ${{ctx.raw.toLocaleString()}} (${{(ctx.raw/D.meta.total*100).toFixed(1)}}%)`}}}}}}}}}});
-new Chart(document.getElementById('yearlyBar'),{{type:'bar',data:{{labels:D.yearly.labels,datasets:[{{data:D.yearly.counts,backgroundColor:D.yearly.counts.map((v,i)=>i===D.yearly.counts.indexOf(Math.max(...D.yearly.counts))?C.purple:'rgba(108,43,219,0.35)'),borderRadius:6,borderSkipped:false}}]}},options:{{...CD,plugins:{{...CD.plugins,legend:{{display:false}}}},scales:{{x:{{grid:{{color:'rgba(255,255,255,0.04)'}},ticks:{{color:C.muted}}}},y:{{grid:{{color:'rgba(255,255,255,0.04)'}},ticks:{{color:C.muted}}}}}}}}}});
-new Chart(document.getElementById('monthlyLine'),{{type:'line',data:{{labels:D.monthly.labels,datasets:[{{data:D.monthly.all,label:'Reviews',borderColor:C.purple,backgroundColor:'rgba(108,43,219,0.1)',fill:true,tension:0.4,pointRadius:0}}]}},options:{{...CD,plugins:{{...CD.plugins,legend:{{display:false}}}},scales:{{x:{{grid:{{display:false}},ticks:{{color:C.muted,maxTicksLimit:8}}}},y:{{grid:{{color:'rgba(255,255,255,0.04)'}},ticks:{{color:C.muted}}}}}}}}}});
-new Chart(document.getElementById('ratingBarOverview'),{{type:'bar',indexAxis:'y',data:{{labels:['1★','2★','3★','4★','5★'],datasets:[{{data:D.rating_all,backgroundColor:[C.red,'#e67e22',C.yellow,'#27ae60',C.green],borderRadius:5,borderSkipped:false}}]}},options:{{...CD,plugins:{{...CD.plugins,legend:{{display:false}}}},scales:{{x:{{grid:{{color:'rgba(255,255,255,0.04)'}},ticks:{{color:C.muted}}}},y:{{grid:{{display:false}},ticks:{{color:C.text}}}}}}}}}});
+const invMetaTotal=100/D.meta.total;
+// busiest year, found in one pass; also scales the trends timeline
+let yearMax=-Infinity,yearMaxIdx=0;
+for(let i=0;i<D.yearly.counts.length;i++)if(D.yearly.counts[i]>yearMax){{yearMax=D.yearly.counts[i];yearMaxIdx=i;}}
+new Chart(document.getElementById('sentimentDonut'),{{type:'doughnut',data:{{labels:['Positive (4-5★)','Neutral (3★)','Negative (1-2★)'],datasets:[{{data:[D.meta.count_pos,D.meta.count_neu,D.meta.count_neg],backgroundColor:[C.green,C.yellow,C.red],borderWidth:3,borderColor:C.card,hoverOffset:8}}]}},options:{{...CD,cutout:'68%',plugins:{{...CD.plugins,tooltip:{{callbacks:{{label:ctx=>` ${{ctx.label}}: ${{ctx.raw.toLocaleString()}} (${{(ctx.raw*invMetaTotal).toFixed(1)}}%)`}}}}}}}}}});
+new Chart(document.getElementById('yearlyBar'),{{type:'bar',data:{{labels:D.yearly.labels,datasets:[{{data:D.yearly.counts,backgroundColor:D.yearly.counts.map((v,i)=>i===yearMaxIdx?C.purple:'rgba(108,43,219,0.35)'),borderRadius:6,borderSkipped:false}}]}},options:{{...CD,plugins:NO_LEGEND,scales:{{x:{{grid:FAINT_GRID,ticks:MUTED_TICKS}},y:{{grid:FAINT_GRID,ticks:MUTED_TICKS}}}}}}}});
+new Chart(document.getElementById('monthlyLine'),{{type:'line',data:{{labels:D.monthly.labels,datasets:[{{data:decimate(D.monthly.all,plotWidth('monthlyLine')),label:'Reviews',borderColor:C.purple,backgroundColor:'rgba(108,43,219,0.1)',fill:true,tension:0.4,pointRadius:0,spanGaps:true}}]}},options:{{...CD,parsing:false,plugins:NO_LEGEND,scales:{{x:{{grid:NO_GRID,ticks:{{color:C.muted,maxTicksLimit:8}}}},y:{{grid:FAINT_GRID,ticks:MUTED_TICKS}}}}}}}});
+new Chart(document.getElementById('ratingBarOverview'),{{type:'bar',indexAxis:'y',data:{{labels:['1★','2★','3★','4★','5★'],datasets:[{{data:D.rating_all,backgroundColor:[C.red,'#e67e22',C.yellow,'#27ae60',C.green],borderRadius:5,borderSkipped:false}}]}},options:{{...CD,plugins:NO_LEGEND,scales:{{x:{{grid:FAINT_GRID,ticks:MUTED_TICKS}},y:{{grid:NO_GRID,ticks:{{color:C.text}}}}}}}}}});
 
 // ── RATINGS ──
-const yearBtns=document.getElementById('year-filter-btns');
-Object.keys(D.rating_by_year).forEach(yr=>{{const b=document.createElement('button');b.className='filter-btn';b.textContent=yr;b.onclick=()=>filterRatings(yr,b);yearBtns.appendChild(b);}});
-let ratingBarChart=new Chart(document.getElementById('ratingBarDetail'),{{type:'bar',data:{{labels:['1★','2★','3★','4★','5★'],datasets:[{{data:D.rating_all,backgroundColor:[C.red,'#e67e22',C.yellow,'#27ae60',C.green],borderRadius:8,borderSkipped:false}}]}},options:{{...CD,plugins:{{...CD.plugins,legend:{{display:false}}}},scales:{{x:{{grid:{{display:false}},ticks:{{color:C.text,font:{{size:14,weight:'bold'}}}}}},y:{{grid:{{color:'rgba(255,255,255,0.04)'}},ticks:{{color:C.muted}}}}}},animation:{{duration:600,easing:'easeOutQuart'}}}}}});
-let sentPie=new Chart(document.getElementById('sentimentPie'),{{type:'pie',data:{{labels:['Positive','Neutral','Negative'],datasets:[{{data:[D.meta.count_pos,D.meta.count_neu,D.meta.count_neg],backgroundColor:[C.green,C.yellow,C.red],borderWidth:3,borderColor:C.card,hoverOffset:10}}]}},options:{{...CD,plugins:{{...CD.plugins,tooltip:{{callbacks:{{label:ctx=>` ${{ctx.label}}: ${{(ctx.raw/D.meta.total*100).toFixed(1)}}%`}}}}}}}}}});
-const rolling=D.monthly.avg_rating.map((v,i,a)=>i===0||i===a.length-1?v:+((a[i-1]+v+a[i+1])/3).toFixed(2));
-new Chart(document.getElementById('ratingTrend'),{{type:'line',data:{{labels:D.monthly.labels,datasets:[{{label:'Monthly avg',data:D.monthly.avg_rating,borderColor:'rgba(255,255,255,0.2)',fill:false,tension:0.4,pointRadius:0}},{{label:'3-month rolling',data:rolling,borderColor:C.purple,borderWidth:2.5,fill:false,tension:0.4,pointRadius:0}},{{label:'Overall avg',data:D.monthly.labels.map(()=>D.meta.avg_rating),borderColor:C.red,borderDash:[6,3],borderWidth:1.5,pointRadius:0,fill:false}}]}},options:{{...CD,scales:{{x:{{grid:{{display:false}},ticks:{{color:C.muted,maxTicksLimit:8}}}},y:{{min:1,max:5,grid:{{color:'rgba(255,255,255,0.04)'}},ticks:{{color:C.muted}}}}}}}}}});
+let ratingBarChart,sentPie;
+function initRatingsPage(){{
+  const yearBtns=document.getElementById('year-filter-btns');
+  const yearFrag=document.createDocumentFragment();
+  Object.keys(D.rating_by_year).forEach(yr=>{{const b=document.createElement('button');b.className='filter-btn';b.textContent=yr;b.onclick=()=>filterRatings(yr,b);yearFrag.appendChild(b);}});
+  yearBtns.appendChild(yearFrag);
+  ratingBarChart=new Chart(document.getElementById('ratingBarDetail'),{{type:'bar',data:{{labels:['1★','2★','3★','4★','5★'],datasets:[{{data:D.rating_all,backgroundColor:[C.red,'#e67e22',C.yellow,'#27ae60',C.green],borderRadius:8,borderSkipped:false}}]}},options:{{...CD,plugins:NO_LEGEND,scales:{{x:{{grid:NO_GRID,ticks:{{color:C.text,font:{{size:14,weight:'bold'}}}}}},y:{{grid:FAINT_GRID,ticks:MUTED_TICKS}}}},animation:{{duration:600,easing:'easeOutQuart',onComplete:revealOnce}}}}}});
+  sentPie=new Chart(document.getElementById('sentimentPie'),{{type:'pie',data:{{labels:['Positive','Neutral','Negative'],datasets:[{{data:[D.meta.count_pos,D.meta.count_neu,D.meta.count_neg],backgroundColor:[C.green,C.yellow,C.red],borderWidth:3,borderColor:C.card,hoverOffset:10}}]}},options:{{...CD,animation:{{onComplete:revealOnce}},plugins:{{...CD.plugins,tooltip:{{callbacks:{{label:ctx=>` ${{ctx.label}}: ${{(ctx.raw*invMetaTotal).toFixed(1)}}%`}}}}}}}}}});
+  const ar=D.monthly.avg_rating,n=ar.length,rolling=new Float64Array(n);
+  rolling[0]=ar[0];rolling[n-1]=ar[n-1];
+  for(let i=1;i<n-1;i++)rolling[i]=Math.round((ar[i-1]+ar[i]+ar[i+1])/3*100)/100;
+  const rtW=plotWidth('ratingTrend');
+  new Chart(document.getElementById('ratingTrend'),{{type:'line',data:{{labels:D.monthly.labels,datasets:[{{label:'Monthly avg',data:decimate(D.monthly.avg_rating,rtW),borderColor:'rgba(255,255,255,0.2)',fill:false,tension:0.4,pointRadius:0,spanGaps:true}},{{label:'3-month rolling',data:decimate(rolling,rtW),borderColor:C.purple,borderWidth:2.5,fill:false,tension:0.4,pointRadius:0,spanGaps:true}},{{label:'Overall avg',data:decimate(D.monthly.labels.map(()=>D.meta.avg_rating),rtW),borderColor:C.red,borderDash:[6,3],borderWidth:1.5,pointRadius:0,fill:false,spanGaps:true}}]}},options:{{...CD,parsing:false,scales:{{x:{{grid:NO_GRID,ticks:{{color:C.muted,maxTicksLimit:8}}}},y:{{min:1,max:5,grid:FAINT_GRID,ticks:MUTED_TICKS}}}}}}}});
+}}
 
 function filterRatings(yr,btn){{
   document.querySelectorAll('#page-ratings .filter-btn').forEach(b=>b.classList.remove('active'));
   btn.classList.add('active');
   document.getElementById('rating-year-badge').textContent=yr==='all'?'All Years':yr;
   const d=yr==='all'?D.rating_all:D.rating_by_year[yr];
-  ratingBarChart.data.datasets[0].data=d; ratingBarChart.update();
+  ratingBarChart.data.datasets[0].data=d; scheduleUpdate(ratingBarChart);
   const total=d.reduce((a,b)=>a+b,0);
   const pos=d[3]+d[4],neg=d[0]+d[1],neu=d[2];
-  sentPie.data.datasets[0].data=[pos,neu,neg]; sentPie.update();
+  sentPie.data.datasets[0].data=[pos,neu,neg]; scheduleUpdate(sentPie);
 }}
 
 // ── TRENDS ──
-let trendChart=new Chart(document.getElementById('trendLine'),{{type:'line',data:{{labels:D.monthly.labels,datasets:[{{label:'All Reviews',data:D.monthly.all,borderColor:C.purple,backgroundColor:'rgba(108,43,219,0.12)',fill:true,tension:0.4,pointRadius:2,pointHoverRadius:6}}]}},options:{{...CD,scales:{{x:{{grid:{{display:false}},ticks:{{color:C.muted,maxTicksLimit:10}}}},y:{{grid:{{color:'rgba(255,255,255,0.04)'}},ticks:{{color:C.muted}}}}}}}}}});
+let trendChart,trendSel='all';
+function initTrendsPage(){{
+  trendChart=new Chart(document.getElementById('trendLine'),{{type:'line',data:{{labels:D.monthly.labels,datasets:[{{label:'All Reviews',data:decimate(D.monthly.all,plotWidth('trendLine')),borderColor:C.purple,backgroundColor:'rgba(108,43,219,0.12)',fill:true,tension:0.4,pointRadius:2,pointHoverRadius:6,spanGaps:true}}]}},options:{{...CD,parsing:false,animation:{{onComplete:revealOnce}},scales:{{x:{{grid:NO_GRID,ticks:{{color:C.muted,maxTicksLimit:10}}}},y:{{grid:FAINT_GRID,ticks:MUTED_TICKS}}}}}}}});
+  if(trendSel!=='all')switchTrend(trendSel);
+  const tl=document.getElementById('timeline-chart');
+  setHTML(tl,D.yearly.labels.map((yr,i)=>{{
+    const w=Math.round(D.yearly.counts[i]/yearMax*100);
+    return `<div class="timeline-item"><div class="timeline-year">${{yr}}</div><div class="timeline-bar-wrap"><div class="timeline-bar" style="width:0%" data-w="${{w}}%"></div><div class="timeline-count">${{D.yearly.counts[i].toLocaleString()}} reviews</div></div></div>`;
+  }}).join(''));
+  setTimeout(()=>tl.querySelectorAll('.timeline-bar').forEach(b=>b.style.width=b.dataset.w+'%'),400);
+  const hm=D.heatmap;
+  const hmPts=hm.x.map((x,i)=>({{x:hm.year_labels[x],y:hm.month_labels[hm.y[i]],r:hm.r[i]}}));
+  const hmColors=hm.v.map(v=>`rgba(108,43,219,${{Math.min(0.9,0.1+v/300)}})`);
+  new Chart(document.getElementById('heatmapChart'),{{type:'bubble',data:{{datasets:[{{data:hmPts,backgroundColor:hmColors,borderColor:'rgba(108,43,219,0.35)',borderWidth:1}}]}},options:{{...CD,animation:false,plugins:{{...CD.plugins,legend:{{display:false}},tooltip:{{callbacks:{{label:ctx=>`${{ctx.raw.y}}, ${{ctx.raw.x}}: ${{hm.v[ctx.dataIndex]}} reviews`}}}}}},scales:{{x:{{type:'category',labels:hm.year_labels,offset:true,grid:NO_GRID,ticks:MUTED_TICKS}},y:{{type:'category',labels:hm.month_labels,offset:true,reverse:true,grid:FAINT_GRID,ticks:MUTED_TICKS}}}}}}}});
+}}
 function switchTrend(t){{
   document.querySelectorAll('#page-trends .filter-btn').forEach(b=>b.classList.remove('active'));
   document.getElementById('trend-'+t).classList.add('active');
+  trendSel=t;
   const map={{all:{{d:D.monthly.all,c:C.purple,l:'All Reviews'}},pos:{{d:D.monthly.pos,c:C.green,l:'Positive'}},neg:{{d:D.monthly.neg,c:C.red,l:'Negative'}}}};
-  const m=map[t]; trendChart.data.datasets[0].data=m.d; trendChart.data.datasets[0].borderColor=m.c;
+  const m=map[t]; trendChart.data.datasets[0].data=decimate(m.d,trendChart.width); trendChart.data.datasets[0].borderColor=m.c;
   trendChart.data.datasets[0].backgroundColor=m.c+'33';
-  trendChart.data.datasets[0].label=m.l; trendChart.update();
+  trendChart.data.datasets[0].label=m.l; scheduleUpdate(trendChart);
 }}
-(()=>{{
-  const tl=document.getElementById('timeline-chart');
-  const mx=Math.max(...D.yearly.counts);
-  tl.innerHTML=D.yearly.labels.map((yr,i)=>{{
-    const w=Math.round(D.yearly.counts[i]/mx*100);
-    return `<div class="timeline-item"><div class="timeline-year">${{yr}}</div><div class="timeline-bar-wrap"><div class="timeline-bar" style="width:0%" data-w="${{w}}%"></div><div class="timeline-count">${{D.yearly.counts[i].toLocaleString()}} reviews</div></div></div>`;
-  }}).join('');
-  setTimeout(()=>tl.querySelectorAll('.timeline-bar').forEach(b=>b.style.width=b.dataset.w+'%'),400);
-}})();
-new Chart(document.getElementById('heatmapChart'),{{type:'bubble',data:{{datasets:[{{data:D.heatmap.data,backgroundColor:ctx=>{{const v=ctx.raw.v;const a=Math.min(0.9,0.1+v/300);return `rgba(108,43,219,${{a}})`;}},borderColor:'rgba(108,43,219,0.35)',borderWidth:1}}]}},options:{{...CD,plugins:{{...CD.plugins,legend:{{display:false}},tooltip:{{callbacks:{{label:ctx=>`${{D.heatmap.month_labels[ctx.raw.y]}}, ${{D.heatmap.year_labels[ctx.raw.x]}}: ${{ctx.raw.v}} reviews`}}}}}},scales:{{x:{{min:-0.5,max:D.heatmap.year_labels.length-0.5,grid:{{display:false}},ticks:{{color:C.muted,callback:v=>D.heatmap.year_labels[v]||''}}}},y:{{min:-0.5,max:11.5,grid:{{color:'rgba(255,255,255,0.04)'}},ticks:{{color:C.muted,callback:v=>D.heatmap.month_labels[v]||''}}}}}}}}}});
 
 // ── WORDS ──
-function renderCloud(type){{
-  const words=D.words[type];const mx=words[0].count;
-  const container=document.getElementById('wordcloud');container.innerHTML='';
-  const pc=['#2ecc71','#27ae60','#1abc9c','#a855f7','#58d68d'];
-  const nc=['#e74c3c','#c0392b','#e67e22','#d35400','#ec407a'];
-  const ac=['#6C2BDB','#E91E8C','#a855f7','#2ecc71','#e74c3c','#3498db'];
-  words.forEach((w,i)=>{{
-    const size=12+(w.count/mx)*28;
-    const colors=type==='pos'?pc:type==='neg'?nc:ac;
-    const el=document.createElement('span');el.className='wc-word';el.textContent=w.word;
-    el.style.fontSize=size+'px';el.style.color=colors[i%colors.length];
-    el.style.opacity=0.6+(w.count/mx)*0.4;el.title=`${{w.word}}: ${{w.count}} occurrences`;
-    container.appendChild(el);
+// The cloud is one canvas: words are packed greedily into centred rows (as the old flex-wrap
+// layout did) and hover is hit-tested against the stored word boxes.
+const CLOUD_COLORS={{
+  pos:['#2ecc71','#27ae60','#1abc9c','#a855f7','#58d68d'],
+  neg:['#e74c3c','#c0392b','#e67e22','#d35400','#ec407a'],
+  all:['#6C2BDB','#E91E8C','#a855f7','#2ecc71','#e74c3c','#3498db'],
+}};
+let cloudType='all',cloudBoxes=[],cloudHover=-1,cloudW=0;
+function layoutCloud(){{
+  const cv=document.getElementById('wordcloud'),ctx=cv.getContext('2d'),W=cv.clientWidth;
+  if(!W)return;
+  const words=D.words[cloudType],mx=words[0].count,colors=CLOUD_COLORS[cloudType],GAP=8,rows=[];
+  cloudBoxes=words.map((w,i)=>{{
+    const size=12+(w.count/mx)*28,font=`700 ${{size}}px Syne, sans-serif`;
+    ctx.font=font;
+    return {{word:w.word,count:w.count,font,color:colors[i%colors.length],alpha:0.6+(w.count/mx)*0.4,
+             w:ctx.measureText(w.word).width+20,h:size*1.2+8,x:0,y:0}};
+  }});
+  let row=null;
+  cloudBoxes.forEach(b=>{{
+    if(!row||row.w+GAP+b.w>W){{row={{items:[],w:-GAP,h:0}};rows.push(row);}}
+    row.items.push(b);row.w+=GAP+b.w;row.h=Math.max(row.h,b.h);
+  }});
+  const used=rows.reduce((s,r)=>s+r.h,0)+GAP*(rows.length-1),H=Math.max(used,168);
+  let y=(H-used)/2;
+  rows.forEach(r=>{{
+    let x=(W-r.w)/2;
+    r.items.forEach(b=>{{b.x=x;b.y=y+(r.h-b.h)/2;x+=b.w+GAP;}});
+    y+=r.h+GAP;
   }});
+  const dpr=window.devicePixelRatio||1;
+  cloudW=W;cv.style.height=H+'px';cv.width=Math.round(W*dpr);cv.height=Math.round(H*dpr);
+  ctx.setTransform(dpr,0,0,dpr,0,0);
+  drawCloud();
 }}
-renderCloud('all');
+function drawCloud(){{
+  const cv=document.getElementById('wordcloud'),ctx=cv.getContext('2d');
+  ctx.clearRect(0,0,cv.width,cv.height);
+  ctx.textAlign='center';ctx.textBaseline='middle';
+  cloudBoxes.forEach((b,i)=>{{
+    const hov=i===cloudHover;
+    ctx.save();ctx.translate(b.x+b.w/2,b.y+b.h/2);if(hov)ctx.scale(1.15,1.15);
+    ctx.font=b.font;ctx.fillStyle=b.color;ctx.globalAlpha=hov?0.9:b.alpha;ctx.fillText(b.word,0,0);
+    ctx.restore();
+  }});
+}}
+function hoverCloud(e){{
+  const r=e.currentTarget.getBoundingClientRect(),x=e.clientX-r.left,y=e.clientY-r.top;
+  const i=cloudBoxes.findIndex(b=>x>=b.x&&x<b.x+b.w&&y>=b.y&&y<b.y+b.h);
+  if(i===cloudHover)return;
+  cloudHover=i;e.currentTarget.title=i<0?'':`${{cloudBoxes[i].word}}: ${{cloudBoxes[i].count}} occurrences`;
+  drawCloud();
+}}
+function renderCloud(type){{cloudType=type;cloudHover=-1;layoutCloud();}}
 function switchCloud(t,btn){{document.querySelectorAll('#page-words .filter-btn').forEach(b=>b.classList.remove('active'));btn.classList.add('active');renderCloud(t);}}
-new Chart(document.getElementById('topWordsPos'),{{type:'bar',indexAxis:'y',data:{{labels:D.words.pos.map(w=>w.word),datasets:[{{data:D.words.pos.map(w=>w.count),label:'Frequency',backgroundColor:'rgba(46,204,113,0.7)',borderRadius:4,borderSkipped:false}}]}},options:{{...CD,plugins:{{...CD.plugins,legend:{{display:false}}}},scales:{{x:{{grid:{{color:'rgba(255,255,255,0.04)'}},ticks:{{color:C.muted}}}},y:{{grid:{{display:false}},ticks:{{color:C.text}}}}}}}}}});
-new Chart(document.getElementById('topWordsNeg'),{{type:'bar',indexAxis:'y',data:{{labels:D.words.neg.map(w=>w.word),datasets:[{{data:D.words.neg.map(w=>w.count),label:'Frequency',backgroundColor:'rgba(231,76,60,0.7)',borderRadius:4,borderSkipped:false}}]}},options:{{...CD,plugins:{{...CD.plugins,legend:{{display:false}}}},scales:{{x:{{grid:{{color:'rgba(255,255,255,0.04)'}},ticks:{{color:C.muted}}}},y:{{grid:{{display:false}},ticks:{{color:C.text}}}}}}}}}});
+function initWordsPage(){{
+  const cv=document.getElementById('wordcloud');
+  cv.addEventListener('mousemove',hoverCloud);
+  cv.addEventListener('mouseleave',()=>{{if(cloudHover>=0){{cloudHover=-1;drawCloud();}}}});
+  new ResizeObserver(()=>{{if(cv.clientWidth!==cloudW)layoutCloud();}}).observe(cv.parentElement);
+  document.fonts.ready.then(layoutCloud);
+  renderCloud('all');
+  new Chart(document.getElementById('topWordsPos'),{{type:'bar',indexAxis:'y',data:{{labels:D.words.pos.map(w=>w.word),datasets:[{{data:D.words.pos.map(w=>w.count),label:'Frequency',backgroundColor:'rgba(46,204,113,0.7)',borderRadius:4,borderSkipped:false}}]}},options:{{...CD,plugins:NO_LEGEND,scales:{{x:{{grid:FAINT_GRID,ticks:MUTED_TICKS}},y:{{grid:NO_GRID,ticks:{{color:C.text}}}}}}}}}});
+  new Chart(document.getElementById('topWordsNeg'),{{type:'bar',indexAxis:'y',data:{{labels:D.words.neg.map(w=>w.word),datasets:[{{data:D.words.neg.map(w=>w.count),label:'Frequency',backgroundColor:'rgba(231,76,60,0.7)',borderRadius:4,borderSkipped:false}}]}},options:{{...CD,plugins:NO_LEGEND,scales:{{x:{{grid:FAINT_GRID,ticks:MUTED_TICKS}},y:{{grid:NO_GRID,ticks:{{color:C.text}}}}}}}}}});
+}}
 
 // ── REVIEWS ──
+// Star strings and review cards are built once; filtering only joins prebuilt strings.
+const STARS=[0,1,2,3,4,5].map(n=>'★'.repeat(n)+' ☆'.repeat(5-n));
+D.top_reviews.forEach(r=>{{r._html=`<div class="review-item"><div class="review-meta"><div class="review-stars ${{r.rating<=2?'neg':''}}">${{STARS[r.rating]}}</div><div class="review-author">${{r.author}}</div><div class="review-date">${{r.date}}</div></div><div class="review-text">${{r.text}}</div><div class="review-thumbs">👍 ${{r.thumbs}} people found this helpful</div></div>`;}});
+const thumbLabels=[],thumbData=[],thumbColors=[];
+for(const r of D.top_reviews.slice(0,8)){{
+  thumbLabels.push(r.author.length>14?r.author.slice(0,14)+'…':r.author);
+  thumbData.push(r.thumbs);
+  thumbColors.push(r.rating<=2?'rgba(231,76,60,0.7)':'rgba(46,204,113,0.7)');
+}}
 function renderReviews(filter){{
   const reviews=filter==='all'?D.top_reviews:filter==='pos'?D.top_reviews.filter(r=>r.rating>=4):D.top_reviews.filter(r=>r.rating<=2);
-  document.getElementById('review-list').innerHTML=reviews.map(r=>`<div class="review-item"><div class="review-meta"><div class="review-stars ${{r.rating<=2?'neg':''}}">${{'★'.repeat(r.rating)}}${{' ☆'.repeat(5-r.rating)}}</div><div class="review-author">${{r.author}}</div><div class="review-date">${{r.date}}</div></div><div class="review-text">${{r.text}}</div><div class="review-thumbs">👍 ${{r.thumbs}} people found this helpful</div></div>`).join('');
+  setHTML(document.getElementById('review-list'),reviews.map(r=>r._html).join(''));
 }}
-renderReviews('all');
 function filterReviews(t,btn){{document.querySelectorAll('#page-reviews .filter-btn').forEach(b=>b.classList.remove('active'));btn.classList.add('active');renderReviews(t);}}
-new Chart(document.getElementById('thumbsChart'),{{type:'bar',indexAxis:'y',data:{{labels:D.top_reviews.slice(0,8).map(r=>r.author.substring(0,14)+'…'),datasets:[{{data:D.top_reviews.slice(0,8).map(r=>r.thumbs),label:'👍',backgroundColor:D.top_reviews.slice(0,8).map(r=>r.rating<=2?'rgba(231,76,60,0.7)':'rgba(46,204,113,0.7)'),borderRadius:4}}]}},options:{{...CD,plugins:{{...CD.plugins,legend:{{display:false}}}},scales:{{x:{{grid:{{color:'rgba(255,255,255,0.04)'}},ticks:{{color:C.muted}}}},y:{{grid:{{display:false}},ticks:{{color:C.text,font:{{size:10}}}}}}}}}}}});
+function initReviewsPage(){{
+  renderReviews('all');
+  new Chart(document.getElementById('thumbsChart'),{{type:'bar',indexAxis:'y',data:{{labels:thumbLabels,datasets:[{{data:thumbData,label:'👍',backgroundColor:thumbColors,borderRadius:4}}]}},options:{{...CD,plugins:NO_LEGEND,scales:{{x:{{grid:FAINT_GRID,ticks:MUTED_TICKS}},y:{{grid:NO_GRID,ticks:{{color:C.text,font:{{size:10}}}}}}}}}}}});
+}}
 
 // ── LANGUAGES ──
-new Chart(document.getElementById('langDonut'),{{type:'doughnut',data:{{labels:D.languages.labels,datasets:[{{data:D.languages.counts,backgroundColor:[C.blue,C.green,C.red,'#9b59b6'],borderWidth:3,borderColor:C.card,hoverOffset:8}}]}},options:{{...CD,cutout:'60%',plugins:{{...CD.plugins,tooltip:{{callbacks:{{label:ctx=>`${{ctx.label}}: ${{ctx.raw}} (${{(ctx.raw/D.languages.counts.reduce((a,b)=>a+b,0)*100).toFixed(1)}}%)`}}}}}}}}}});
-(()=>{{
-  const total=D.languages.counts.reduce((a,b)=>a+b,0);
+function initLanguagesPage(){{
+  const langTotal=D.languages.counts.reduce((a,b)=>a+b,0),invLangTotal=100/langTotal;
+  new Chart(document.getElementById('langDonut'),{{type:'doughnut',data:{{labels:D.languages.labels,datasets:[{{data:D.languages.counts,backgroundColor:[C.blue,C.green,C.red,'#9b59b6'],borderWidth:3,borderColor:C.card,hoverOffset:8}}]}},options:{{...CD,cutout:'60%',plugins:{{...CD.plugins,tooltip:{{callbacks:{{label:ctx=>`${{ctx.label}}: ${{ctx.raw}} (${{(ctx.raw*invLangTotal).toFixed(1)}}%)`}}}}}}}}}});
   const colors=[C.blue,C.green,C.red,'#9b59b6'];
-  document.getElementById('lang-bars').innerHTML=D.languages.labels.map((l,i)=>{{
-    const pct=(D.languages.counts[i]/total*100).toFixed(1);
+  setHTML(document.getElementById('lang-bars'),D.languages.labels.map((l,i)=>{{
+    const pct=(D.languages.counts[i]*invLangTotal).toFixed(1);
     return `<div class="lang-bar-item"><div class="lang-bar-label"><span>${{l}}</span><span style="color:${{colors[i]}}">${{pct}}%</span></div><div class="lang-bar-track"><div class="lang-bar-fill" style="width:0%;background:${{colors[i]}}" data-w="${{pct}}%"></div></div></div>`;
-  }}).join('');
+  }}).join(''));
   setTimeout(()=>document.querySelectorAll('.lang-bar-fill').forEach(b=>b.style.width=b.dataset.w),400);
-}})();
-new Chart(document.getElementById('langRating'),{{type:'bar',data:{{labels:D.languages.labels,datasets:[{{label:'Avg Rating',data:D.languages.avg_ratings,backgroundColor:[C.blue,C.green,C.red,'#9b59b6'],borderRadius:8,borderSkipped:false}}]}},options:{{...CD,plugins:{{...CD.plugins,legend:{{display:false}}}},scales:{{x:{{grid:{{display:false}},ticks:{{color:C.text}}}},y:{{min:0,max:5,grid:{{color:'rgba(255,255,255,0.04)'}},ticks:{{color:C.muted}}}}}}}}}});
+  new Chart(document.getElementById('langRating'),{{type:'bar',data:{{labels:D.languages.labels,datasets:[{{label:'Avg Rating',data:D.languages.avg_ratings,backgroundColor:[C.blue,C.green,C.red,'#9b59b6'],borderRadius:8,borderSkipped:false}}]}},options:{{...CD,plugins:NO_LEGEND,scales:{{x:{{grid:NO_GRID,ticks:{{color:C.text}}}},y:{{min:0,max:5,grid:FAINT_GRID,ticks:MUTED_TICKS}}}}}}}});
+}}
 
 // ── INSIGHTS ──
-new Chart(document.getElementById('lengthChart'),{{type:'bar',data:{{labels:['Positive (4-5★)','Neutral (3★)','Negative (1-2★)'],datasets:[{{label:'Avg Characters',data:[D.meta.avg_len_pos,D.meta.avg_len_neu,D.meta.avg_len_neg],backgroundColor:[C.green,C.yellow,C.red],borderRadius:8,borderSkipped:false}}]}},options:{{...CD,plugins:{{...CD.plugins,legend:{{display:false}}}},scales:{{x:{{grid:{{display:false}},ticks:{{color:C.text}}}},y:{{grid:{{color:'rgba(255,255,255,0.04)'}},ticks:{{color:C.muted}},title:{{display:true,text:'Avg Characters',color:C.muted}}}}}}}}}});
-new Chart(document.getElementById('stackedBar'),{{type:'bar',data:{{labels:D.stacked.years,datasets:[{{label:'5★',data:D.stacked.by_star['5'],backgroundColor:C.green,borderRadius:2}},{{label:'4★',data:D.stacked.by_star['4'],backgroundColor:'#27ae60',borderRadius:2}},{{label:'3★',data:D.stacked.by_star['3'],backgroundColor:C.yellow,borderRadius:2}},{{label:'2★',data:D.stacked.by_star['2'],backgroundColor:'#e67e22',borderRadius:2}},{{label:'1★',data:D.stacked.by_star['1'],backgroundColor:C.red,borderRadius:2}}]}},options:{{...CD,scales:{{x:{{stacked:true,grid:{{display:false}},ticks:{{color:C.text}}}},y:{{stacked:true,grid:{{color:'rgba(255,255,255,0.04)'}},ticks:{{color:C.muted}}}}}}}}}});
-document.getElementById('rec-grid').innerHTML=[
-  {{icon:'🚗',title:'Driver Quality',text:'Implement real-time driver rating alerts. Driver behavior is the #1 variable in user satisfaction across all languages.'}},
-  {{icon:'🐛',title:'Bug Fixes',text:'Rating dips correlate with app updates. Strengthen QA testing pipelines before each release.'}},
-  {{icon:'💰',title:'Pricing Transparency',text:'Users feel surprised by surge pricing. Add clear fee breakdowns before confirming orders.'}},
-  {{icon:'🇩🇿',title:'Arabic Support',text:'Arabic reviewers are an underserved segment. Prioritize Arabic UI and dedicated customer support.'}},
-  {{icon:'📊',title:'Monthly Monitoring',text:'Build an internal dashboard to track review sentiment monthly and catch issues before they escalate.'}},
-  {{icon:'🤖',title:'NLP Next Steps',text:'Train a multilingual sentiment classifier. Aspect-based analysis for drivers, pricing, and bugs.'}}
-].map(r=>`<div class="chart-card" style="padding:16px"><div style="font-size:22px;margin-bottom:8px">${{r.icon}}</div><div style="font-family:'Syne',sans-serif;font-weight:700;font-size:13px;margin-bottom:6px;color:#a855f7">${{r.title}}</div><div style="font-size:12px;color:#c0c0d8;line-height:1.6">${{r.text}}</div></div>`).join('');
+function initInsightsPage(){{
+  new Chart(document.getElementById('lengthChart'),{{type:'bar',data:{{labels:['Positive (4-5★)','Neutral (3★)','Negative (1-2★)'],datasets:[{{label:'Avg Characters',data:[D.meta.avg_len_pos,D.meta.avg_len_neu,D.meta.avg_len_neg],backgroundColor:[C.green,C.yellow,C.red],borderRadius:8,borderSkipped:false}}]}},options:{{...CD,plugins:NO_LEGEND,scales:{{x:{{grid:NO_GRID,ticks:{{color:C.text}}}},y:{{grid:FAINT_GRID,ticks:MUTED_TICKS,title:{{display:true,text:'Avg Characters',color:C.muted}}}}}}}}}});
+  new Chart(document.getElementById('stackedBar'),{{type:'bar',data:{{labels:D.stacked.years,datasets:[{{label:'5★',data:D.stacked.by_star['5'],backgroundColor:C.green,borderRadius:2}},{{label:'4★',data:D.stacked.by_star['4'],backgroundColor:'#27ae60',borderRadius:2}},{{label:'3★',data:D.stacked.by_star['3'],backgroundColor:C.yellow,borderRadius:2}},{{label:'2★',data:D.stacked.by_star['2'],backgroundColor:'#e67e22',borderRadius:2}},{{label:'1★',data:D.stacked.by_star['1'],backgroundColor:C.red,borderRadius:2}}]}},options:{{...CD,scales:{{x:{{stacked:true,grid:NO_GRID,ticks:{{color:C.text}}}},y:{{stacked:true,grid:FAINT_GRID,ticks:MUTED_TICKS}}}}}}}});
+  setHTML(document.getElementById('rec-grid'),[
+    {{icon:'🚗',title:'Driver Quality',text:'Implement real-time driver rating alerts. Driver behavior is the #1 variable in user satisfaction across all languages.'}},
+    {{icon:'🐛',title:'Bug Fixes',text:'Rating dips correlate with app updates. Strengthen QA testing pipelines before each release.'}},
+    {{icon:'💰',title:'Pricing Transparency',text:'Users feel surprised by surge pricing. Add clear fee breakdowns before confirming orders.'}},
+    {{icon:'🇩🇿',title:'Arabic Support',text:'Arabic reviewers are an underserved segment. Prioritize Arabic UI and dedicated customer support.'}},
+    {{icon:'📊',title:'Monthly Monitoring',text:'Build an internal dashboard to track review sentiment monthly and catch issues before they escalate.'}},
+    {{icon:'🤖',title:'NLP Next Steps',text:'Train a multilingual sentiment classifier. Aspect-based analysis for drivers, pricing, and bugs.'}}
+  ].map(r=>`<div class="chart-card" style="padding:16px"><div style="font-size:22px;margin-bottom:8px">${{r.icon}}</div><div style="font-family:'Syne',sans-serif;font-weight:700;font-size:13px;margin-bottom:6px;color:#a855f7">${{r.title}}</div><div style="font-size:12px;color:#c0c0d8;line-height:1.6">${{r.text}}</div></div>`).join(''));
+}}
+
+// ── LAZY PAGE INIT ──
+// Overview is built eagerly for first paint; every other page builds its charts on first visit.
+const PAGE_INIT={{ratings:initRatingsPage,trends:initTrendsPage,words:initWordsPage,reviews:initReviewsPage,languages:initLanguagesPage,insights:initInsightsPage}};
+const initialized=new Set(['overview']);
+// The heaviest pages give their charts back when left and rebuild them on return.
+const DESTROY_ON_HIDE=new Set(['trends','insights']);
+function releasePage(id){{
+  document.querySelectorAll('#page-'+id+' canvas').forEach(cv=>{{
+    const ch=Chart.getChart(cv);
+    if(ch){{pendingUpdates.delete(ch);ch.destroy();}}
+  }});
+  initialized.delete(id);
+}}
 
 // ── INIT ANIMATIONS ──
 setTimeout(()=>document.querySelectorAll('#page-overview .animate-in').forEach((el,i)=>setTimeout(()=>el.classList.add('visible'),i*100)),100);